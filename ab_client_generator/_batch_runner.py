@@ -0,0 +1,45 @@
+"""_batch_runner.py - long-lived SDK generator process used by `cli generate`.
+
+Imports `ab_openapi_python_generator` once, then generates one SDK per
+newline-delimited JSON request read from stdin:
+
+    {"spec": "/path/to/openapi.json", "out": "/path/to/module_dir"}
+
+answering `{"ok": true}` (or `{"ok": false}`, with a traceback on stderr) on
+stdout after each one. Unlike the dumper, no service code is imported here, so a
+single process can safely serve every service in the run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import traceback
+
+from ab_openapi_python_generator.generate_data import generate_data
+
+
+def main() -> None:
+    """Serve generation requests until stdin is closed."""
+    # Keep stdout for replies; the generator's own progress output goes to stderr.
+    reply = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            generate_data(request["spec"], request["out"])
+        except Exception:  # noqa: BLE001
+            traceback.print_exc()
+            ok = False
+        else:
+            ok = True
+
+        sys.stdout.flush()
+        reply.write(json.dumps({"ok": ok}) + "\n")
+        reply.flush()
+
+
+if __name__ == "__main__":
+    main()
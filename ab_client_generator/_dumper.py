@@ -0,0 +1,97 @@
+"""_dumper.py - warm, single-use OpenAPI dumper process used by `cli generate`.
+
+The interpreter boots and imports FastAPI's OpenAPI helpers *before* it is handed
+a service, so the CLI can keep one ready while other services are being processed.
+It then serves exactly one newline-delimited JSON request read from stdin:
+
+    {"module": "ab_service.<svc>.main"}
+
+streams the OpenAPI JSON back on stdout, and exits (non-zero, with a traceback on
+stderr, if the spec could not be produced). The spec never has to touch disk on
+its way to the CLI.
+
+One service per process keeps import side-effects (SQLAlchemy metadata, global
+singletons, etc.) isolated between services; the CLI respawns a fresh dumper
+for the next one.
+
+For a one-off dump (debugging a single service), pass the module and an optional
+output file on the command line instead:
+
+    python -m ab_client_generator._dumper ab_service.<svc>.main [openapi.json]
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+import traceback
+from typing import TextIO
+
+from fastapi.openapi.utils import get_openapi
+
+
+def dump_openapi(module_path: str, out: TextIO) -> None:
+    """Import `module_path` and write the OpenAPI JSON of its `app` to `out`."""
+    mod = importlib.import_module(module_path)
+    app = getattr(mod, "app", None)
+    if app is None:
+        raise RuntimeError(f"{module_path!r} has no attribute 'app'")
+
+    spec = get_openapi(title=app.title, version=app.version, routes=app.routes)
+
+    json.dump(spec, out, indent=2)
+
+
+def _claim_stdout() -> TextIO:
+    """Return a private handle on stdout and point fd 1 at stderr.
+
+    The spec then owns stdout; anything the service prints on import goes to stderr.
+    """
+    reply = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return reply
+
+
+def dump_once(module_path: str, out_path: str | None = None) -> None:
+    """Dump one service's spec to `out_path`, or to stdout if not given."""
+    if out_path is None:
+        with _claim_stdout() as reply:
+            dump_openapi(module_path, reply)
+        return
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        dump_openapi(module_path, f)
+
+
+def main() -> None:
+    """Serve a single dump request, then exit."""
+    reply = _claim_stdout()
+
+    line = sys.stdin.readline()
+    if not line:  # parent shut down without handing us a service
+        os._exit(0)
+
+    request = json.loads(line)
+    try:
+        dump_openapi(request["module"], reply)
+        reply.flush()
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        ok = False
+    else:
+        ok = True
+
+    sys.stderr.flush()
+
+    # Skip interpreter teardown: the service's atexit hooks and global state are
+    # exactly what we isolate, and this process is never reused.
+    os._exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        dump_once(*sys.argv[1:3])
+    else:
+        main()
@@ -1,8 +1,7 @@
 """generate.py - build typed SDKs for every FastAPI service installed under
 `ab_service.<service>.main`, by dumping OpenAPI JSON in an isolated subprocess,
-then generating a client module via:
-
-    uv run ab-openapi-python-generator <openapi.json|url> <output_module_dir>
+then generating a client module with `ab_openapi_python_generator` (the library
+behind `ab-openapi-python-generator <openapi.json|url> <output_module_dir>`).
 
 Output directory NOTE:
 - This generator writes into the *python module directory itself*.
@@ -13,18 +12,33 @@ Example:
 Run:
     poetry run generate            # real generation
     poetry run generate --dry      # preview only (no files written)
+    poetry run generate --keep-spec  # also keep <service>-openapi.json at the org root
+    poetry run generate --force    # regenerate even if the OpenAPI spec is unchanged
+    poetry run generate --timeout 3600  # per-service generation limit (default 1800s; or AB_GENERATE_TIMEOUT)
 
 """
 
 from __future__ import annotations
 
-import importlib
+import contextlib
+import importlib.util
+import json
+import os
 import pkgutil
+import random
 import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
 from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache, partial
 from pathlib import Path
+from typing import IO, Any
 
 import typer
 
@@ -45,140 +59,546 @@ def iter_service_module_names() -> Iterator[tuple[str, str]]:
 
     IMPORTANT: Do not import the service module here. Importing multiple FastAPI
     apps in the same interpreter can cause side-effect collisions (e.g. SQLAlchemy
-    Table/Column re-registration).
+    Table/Column re-registration). Checking that a module actually exposes `app`
+    is left to the dumper subprocess.
     """
-    try:
-        ns_pkg = importlib.import_module("ab_service")
-    except ImportError:
+    # Locate the namespace without importing it, so nothing under `ab_service`
+    # ever executes in this process.
+    ns_spec = importlib.util.find_spec("ab_service")
+    if ns_spec is None or not ns_spec.submodule_search_locations:
         return  # namespace package not installed
 
-    for info in pkgutil.walk_packages(ns_pkg.__path__, prefix="ab_service."):
-        if not info.name.endswith(".main"):
+    # Only look two levels deep: `walk_packages` would import every subpackage
+    # just to recurse into it, which is exactly the side effect we avoid here.
+    for svc_info in pkgutil.iter_modules(ns_spec.submodule_search_locations):
+        if not svc_info.ispkg:
             continue
 
-        # info.name looks like: ab_service.<svc>.main
-        parts = info.name.split(".")
-        if len(parts) < 3:
+        root = getattr(svc_info.module_finder, "path", None)  # FileFinder root; absent for zip imports
+        if root is None:
             continue
 
-        service = parts[1]
-        yield service, info.name
+        service = svc_info.name
+        svc_path = os.path.join(root, service)
+        for info in pkgutil.iter_modules([svc_path], prefix=f"ab_service.{service}."):
+            if info.name.endswith(".main"):
+                yield service, info.name
 
 
-def _dump_openapi_in_subprocess(module_path: str, spec_path: Path, *, dry: bool) -> None:
-    """Import the FastAPI service module in a fresh Python process and write OpenAPI JSON.
+def _popen(cmd: list[str], **kwargs: Any) -> subprocess.Popen[bytes]:
+    """Start a child process, keeping it eligible for subprocess's `posix_spawn` fast path.
 
-    This isolates import side-effects (SQLAlchemy metadata, global singletons, etc.)
-    between services.
+    CPython only uses posix_spawn instead of fork+exec (which copies the page tables
+    of this whole interpreter) when the executable is an absolute path, close_fds is
+    off, and no cwd / preexec_fn / pass_fds / session / process-group options are
+    given. Callers must not add any of those. close_fds=False leaks nothing: every fd
+    Python opens is non-inheritable by default (PEP 446).
     """
-    py = f"""
-import importlib, json
-from fastapi.openapi.utils import get_openapi
+    return subprocess.Popen(cmd, close_fds=False, **kwargs)
 
-mod = importlib.import_module({module_path!r})
-app = getattr(mod, "app", None)
-if app is None:
-    raise RuntimeError(f"{{{module_path!r}}} has no attribute 'app'")
 
-spec = get_openapi(title=app.title, version=app.version, routes=app.routes)
+DUMPER_CMD = [sys.executable, "-u", "-m", "ab_client_generator._dumper"]
+LOG_TAIL_LINES = 1024  # child output kept for diagnostics when a step fails
 
-with open({str(spec_path)!r}, "w", encoding="utf-8") as f:
-    json.dump(spec, f, indent=2)
 
-print("OK")
-"""
+def _child_log() -> IO[bytes]:
+    """Create a temp file to receive a child's diagnostics.
 
-    cmd = [sys.executable, "-c", py]
+    Output goes to a file rather than a pipe so it can never fill up while we are
+    busy elsewhere. The child shares the file offset, so only read it while the
+    child is idle or gone.
+    """
+    return tempfile.TemporaryFile()
 
-    if dry:
-        typer.echo(f"[DRY] Would dump OpenAPI via subprocess:\n  {' '.join(cmd)}\n")
-        return
 
-    spec_path.parent.mkdir(parents=True, exist_ok=True)
+def _log_tail(log: IO[bytes]) -> str:
+    """Return the last `LOG_TAIL_LINES` lines written to a child log."""
+    log.seek(0)
+    return b"".join(deque(log, maxlen=LOG_TAIL_LINES)).decode(errors="replace")
 
-    proc = subprocess.run(
-        cmd,
-        cwd=str(RUN_DIR),
-        text=True,
-        capture_output=True,
-    )
-    if proc.returncode != 0:
-        raise RuntimeError(
-            "Failed to dump OpenAPI.\n"
-            f"Module: {module_path}\n"
-            f"Spec:   {spec_path}\n\n"
-            f"STDOUT:\n{proc.stdout}\n\n"
-            f"STDERR:\n{proc.stderr}\n"
+
+def _dump_request(module_path: str) -> str:
+    """Encode a request line for the dumper process (see `ab_client_generator._dumper`)."""
+    return json.dumps({"module": module_path}) + "\n"
+
+
+class WarmDumpers:
+    """Keep OpenAPI dumper interpreters booted ahead of demand.
+
+    Each dumper imports the FastAPI service module in a fresh Python process, which
+    isolates import side-effects (SQLAlchemy metadata, global singletons, etc.)
+    between services. Interpreter startup and the FastAPI import happen while the
+    dumper sits idle, so handing it a service only pays for the service itself.
+    Safe to share between worker threads.
+    """
+
+    def __init__(self, total: int, spares: int) -> None:
+        """Prepare dumpers for `total` services, keeping up to `spares` booted ahead."""
+        self._idle: deque[tuple[subprocess.Popen[bytes], IO[bytes]]] = deque()
+        self._lock = threading.Lock()
+        self._remaining = total
+        self._spares = spares
+        with self._lock:
+            self._top_up()
+
+    def _spawn(self) -> tuple[subprocess.Popen[bytes], IO[bytes]]:
+        # The spec streams back over stdout; diagnostics go to a temp file.
+        log = _child_log()
+        proc = _popen(
+            DUMPER_CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=log,
         )
+        return proc, log
+
+    def _top_up(self) -> None:
+        while len(self._idle) < min(self._spares, self._remaining):
+            self._idle.append(self._spawn())
+
+    def take(self) -> tuple[subprocess.Popen[bytes], IO[bytes]]:
+        """Return an idle dumper (spawning one if none is ready) and its log file."""
+        with self._lock:
+            dumper = self._idle.popleft() if self._idle else self._spawn()
+            self._remaining -= 1
+            # Boot the next dumper while this one works.
+            self._top_up()
+        return dumper
+
+    def close(self) -> None:
+        """Shut down dumpers that were never handed a service."""
+        with self._lock:
+            while self._idle:
+                proc, log = self._idle.popleft()
+                assert proc.stdin is not None
+                proc.stdin.close()  # EOF → dumper exits without importing anything
+                proc.wait()
+                log.close()
+
+
+RUNNER_CMD = [sys.executable, "-u", "-m", "ab_client_generator._batch_runner"]
+GENERATE_TIMEOUT = 1800  # default seconds one service's generation may take before its runner is killed
+GENERATE_ATTEMPTS = 3  # tries per service when the runner process itself dies
+EOF_EXIT_GRACE = 5  # seconds a runner that closed its stdout gets to exit on its own
+
+
+def _generate_request(spec_path: Path, out_module_dir: Path) -> str:
+    """Encode a request line for a generator process (see `ab_client_generator._batch_runner`)."""
+    return json.dumps({"spec": str(spec_path), "out": str(out_module_dir)}) + "\n"
+
+
+class GeneratorRunner:
+    """A long-lived `ab_client_generator._batch_runner` process.
+
+    The generator is imported once per runner and then fed one service at a time,
+    instead of paying `uv run` + interpreter + generator import for every service.
+    """
+
+    def __init__(self) -> None:
+        """Boot the runner process; it sits idle until handed a service."""
+        # Generator chatter is only kept for the failure report, never echoed.
+        self.log = _child_log()
+        self.timed_out = False  # set when the watchdog killed the runner during the last job
+        self.proc = _popen(
+            RUNNER_CMD,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self.log,
+        )
+
+    def _kill_hung(self) -> None:
+        self.timed_out = True
+        self.proc.kill()
+
+    def generate(self, job: ServiceJob, timeout: float) -> tuple[bool, str]:
+        """Generate the SDK for `job` (whose spec must already be written) and wait for it.
+
+        Returns whether generation succeeded and, on failure, the tail of the
+        runner's output. A runner that died, or was killed after `timeout` seconds
+        (see `timed_out`), replies with EOF, which counts as a failure; check `alive`
+        before reusing it.
+        """
+        assert self.proc.stdin is not None and self.proc.stdout is not None and job.spec_path is not None
+        self.timed_out = False
+        watchdog = threading.Timer(timeout, self._kill_hung)
+        watchdog.start()
+        try:
+            self.proc.stdin.write(_generate_request(job.spec_path, job.out_module_dir).encode())
+            self.proc.stdin.flush()
+            line = self.proc.stdout.readline()
+        except BrokenPipeError:
+            line = b""  # runner was already gone
+        finally:
+            watchdog.cancel()
+
+        if not line:  # EOF: the runner is exiting; reap it before `alive` / `returncode` are checked
+            try:
+                self.proc.wait(EOF_EXIT_GRACE)  # let it exit by itself so `returncode` says why
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+        ok = bool(line) and json.loads(line)["ok"]
+        output = "" if ok else _log_tail(self.log)
+        # The runner is idle now: rewind the shared offset so the next job starts a fresh log.
+        self.log.seek(0)
+        self.log.truncate()
+        return ok, output
+
+    @property
+    def alive(self) -> bool:
+        """Whether the runner process is still up."""
+        return self.proc.poll() is None
+
+    def close(self) -> None:
+        """Let the runner finish its current request and exit."""
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+        with contextlib.suppress(BrokenPipeError):
+            self.proc.stdin.close()  # EOF → runner leaves its request loop
+        self.proc.wait()
+        self.proc.stdout.close()
+        self.log.close()
+
+
+class GeneratorRunners:
+    """One `GeneratorRunner` per worker thread, booted on first use."""
+
+    def __init__(self, timeout: float = GENERATE_TIMEOUT) -> None:
+        """Start with no runners booted; each job may take up to `timeout` seconds."""
+        self._timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: list[GeneratorRunner] = []
+
+    def _runner(self) -> GeneratorRunner:
+        runner: GeneratorRunner | None = getattr(self._local, "runner", None)
+        if runner is None or not runner.alive:
+            runner = self._local.runner = GeneratorRunner()
+            with self._lock:
+                self._all.append(runner)
+        return runner
+
+    def generate(self, job: ServiceJob) -> tuple[bool, str]:
+        """Generate the SDK for `job` on the calling thread's runner (see `GeneratorRunner.generate`).
+
+        If the runner dies mid-job, the job is retried on a fresh runner with
+        jittered exponential backoff. Other failures are returned straight away,
+        since retrying won't help: one the generator reports itself (e.g. an invalid
+        spec), or a timeout (generation is local and CPU-bound, so it would time
+        out again). A runner stopped by Ctrl-C raises `KeyboardInterrupt` instead.
+        """
+        for attempt in range(GENERATE_ATTEMPTS):
+            runner = self._runner()
+            ok, output = runner.generate(job, self._timeout)
+            if ok or runner.alive:
+                break
+
+            if runner.proc.returncode == -signal.SIGINT:
+                raise KeyboardInterrupt  # Ctrl-C reached the whole process group: stop, don't respawn
+
+            if runner.timed_out:
+                typer.echo(f"⏱️  [{job.service_name}] SDK generation timed out after {self._timeout:g}s")
+                break
+
+            if attempt + 1 == GENERATE_ATTEMPTS:
+                break
+
+            typer.echo(f"🔁  [{job.service_name}] Generator runner died, retrying ({attempt + 2}/{GENERATE_ATTEMPTS})")
+            time.sleep(0.5 * 2**attempt + random.random())
+
+        return ok, output
+
+    def close(self) -> None:
+        """Shut every runner down."""
+        with self._lock:
+            for runner in self._all:
+                runner.close()
+            self._all.clear()
 
 
 # ------------------------------------------------------------------ #
-# CLI command                                                        #
+# Per-service pipeline                                               #
 # ------------------------------------------------------------------ #
-@app.command()
-def generate(
-    dry: bool = typer.Option(False, "--dry", "--dry-run", help="Preview only, don't write files"),
-) -> None:
-    """Generate (or preview) client SDK modules for each FastAPI service."""
-    if dry:
-        typer.echo("🌿  DRY-RUN – no files will be written.\n")
+# Modules only a real run needs (hashlib, concurrent.futures) are imported where
+# they are used, so `--help` and `--dry` never pay for them.
+MAX_WORKERS = 8  # services in flight at once; each worker mostly waits on child processes
+SPEC_HASH_FILE = ".ab_spec_hash"  # written into the module dir after a successful generation
+SHM_DIR = Path("/dev/shm")
 
-    any_found = False
 
-    for service, module_path in iter_service_module_names():
-        any_found = True
+@cache
+def _spec_tmp_dir() -> Path:
+    """Pick where temporary specs go: RAM-backed /dev/shm when usable, else the temp dir.
 
+    Keeping specs off the source tree's filesystem means editor indexers, git status
+    scans and sync clients never see them.
+    """
+    if SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return SHM_DIR
+    return Path(tempfile.gettempdir())
+
+
+@dataclass
+class ServiceJob:
+    """Paths and in-flight state for one service moving through the pipeline."""
+
+    service: str
+    module_path: str
+    service_name: str
+    out_module_dir: Path
+    keep_spec: bool = False
+    force: bool = False
+    spec: bytes = b""
+    spec_path: Path | None = None
+
+    @classmethod
+    def plan(cls, service: str, module_path: str, *, keep_spec: bool, force: bool) -> ServiceJob:
+        """Derive the output locations for `ab_service.<service>.main`."""
         package_name = service.replace("_", "-")
         service_name = "service-" + package_name
         client_name = "client-" + package_name
 
-        # OpenAPI JSON is dumped at the org root
-        spec_path = ORG_DIR / f"{service_name}-openapi.json"
-
         # Client repo root (already exists in your org layout)
         client_repo = ORG_DIR / client_name
 
-        # IMPORTANT: generator output dir is the python module dir itself
-        # e.g. client-token-issuer/src/ab_client/token_issuer
-        out_module_dir = client_repo / "src" / "ab_client" / service
+        return cls(
+            service=service,
+            module_path=module_path,
+            service_name=service_name,
+            # IMPORTANT: generator output dir is the python module dir itself
+            # e.g. client-token-issuer/src/ab_client/token_issuer
+            out_module_dir=client_repo / "src" / "ab_client" / service,
+            keep_spec=keep_spec,
+            force=force,
+        )
 
-        # 1) Dump OpenAPI spec (isolated per service in a subprocess)
+    @property
+    def artifact_path(self) -> Path:
+        """Where the OpenAPI JSON is kept at the org root when `--keep-spec` is given."""
+        return ORG_DIR / f"{self.service_name}-openapi.json"
+
+    @property
+    def spec_hash(self) -> str:
+        """Content hash of the streamed spec."""
+        import hashlib
+
+        return hashlib.blake2b(self.spec).hexdigest()
+
+    def sdk_is_current(self) -> bool:
+        """Whether the existing SDK module was generated from an identical spec."""
+        # One directory listing answers both "is there an SDK?" and "is there a hash?"
         try:
-            _dump_openapi_in_subprocess(module_path, spec_path, dry=dry)
-        except Exception as exc:  # noqa: BLE001
-            typer.echo(f"⚠️  Skip {module_path}: {exc}")
-            continue
+            with os.scandir(self.out_module_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            return False
+
+        init, recorded = entries.get("__init__.py"), entries.get(SPEC_HASH_FILE)
+        if init is None or recorded is None or not init.is_file():
+            return False
+
+        with open(recorded.path, encoding="utf-8") as f:
+            return f.read().strip() == self.spec_hash
+
+    def record_spec_hash(self) -> None:
+        """Remember which spec the SDK module was generated from."""
+        (self.out_module_dir / SPEC_HASH_FILE).write_text(self.spec_hash + "\n")
+
+    def write_spec(self) -> Path:
+        """Write the streamed spec where the generator can read it and return that path."""
+        if self.keep_spec:
+            self.spec_path = self.artifact_path
+            self.spec_path.parent.mkdir(parents=True, exist_ok=True)
+            self.spec_path.write_bytes(self.spec)
+        else:
+            fd, name = tempfile.mkstemp(prefix=f"{self.service_name}-", suffix="-openapi.json", dir=_spec_tmp_dir())
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.spec)
+            self.spec_path = Path(name)
+        return self.spec_path
+
+    def discard_spec(self) -> None:
+        """Drop the in-memory spec and any temporary spec file."""
+        self.spec = b""
+        if self.spec_path is not None and not self.keep_spec:
+            self.spec_path.unlink(missing_ok=True)
+
+
+def _preview_service(job: ServiceJob) -> None:
+    """Print what the pipeline would do for one service, without touching disk."""
+    spec_path = job.artifact_path if job.keep_spec else _spec_tmp_dir() / f"{job.service_name}-*.json"
+    typer.echo(f"[DRY] Would dump OpenAPI via subprocess:\n  {' '.join(DUMPER_CMD)} {job.module_path}\n")
+    typer.echo(f"🔧  [{job.service_name}] openapi.json → {spec_path}")
+
+    if job.out_module_dir.exists():
+        typer.echo(f"🧹  [{job.service_name}] Clearing existing module dir → {job.out_module_dir}")
+
+    typer.echo(
+        f"[DRY] Would generate via subprocess:\n  {' '.join(RUNNER_CMD)}"
+        f" <<< {_generate_request(spec_path, job.out_module_dir)}"
+    )
 
-        typer.echo(f"🔧  [{service_name}] openapi.json → {spec_path}")
 
-        # 2) Ensure output module directory exists (and clear it to avoid stale files)
-        if out_module_dir.exists():
-            typer.echo(f"🧹  [{service_name}] Clearing existing module dir → {out_module_dir}")
-            if not dry:
-                shutil.rmtree(out_module_dir)
+def _dump_spec(job: ServiceJob, dumpers: WarmDumpers) -> bool:
+    """Dump a service's OpenAPI spec on a warm dumper; return whether it needs generating."""
+    proc, log = dumpers.take()
+    with log:
+        job.spec, _ = proc.communicate(_dump_request(job.module_path).encode())
+        if proc.returncode == 0:
+            if not job.force and job.sdk_is_current():
+                if job.keep_spec:  # the artifact is still wanted even though generation is skipped
+                    typer.echo(f"🔧  [{job.service_name}] openapi.json → {job.write_spec()}")
+                typer.echo(f"⏭️  [{job.service_name}] OpenAPI unchanged, SDK up to date → {job.out_module_dir}\n")
+                job.discard_spec()
+                return False
 
-        if not dry:
-            out_module_dir.mkdir(parents=True, exist_ok=True)
+            typer.echo(f"🔧  [{job.service_name}] openapi.json → {job.write_spec()}")
+            return True
 
-        # 3) Run the new generator
-        cmd = [
-            "uv",
-            "run",
-            "ab-openapi-python-generator",
-            str(spec_path),  # you can swap to a URL if you prefer
-            str(out_module_dir),  # module directory, not repo root
-        ]
+        output = _log_tail(log)
 
-        if dry:
-            typer.echo("[DRY] Would run:\n  " + " ".join(cmd) + "\n")
-            continue
+    job.discard_spec()
+    typer.echo(f"⚠️  Skip {job.module_path}: Failed to dump OpenAPI.\nModule: {job.module_path}\n\nOUTPUT:\n{output}\n")
+    return False
+
+
+def _remove_stale_dir(job: ServiceJob, stale: Path) -> None:
+    """Delete a module dir moved aside by `_clear_module_dir`, reporting it if anything is left.
+
+    The stale dir sits inside the client package's source tree, so a leftover must
+    not go unnoticed: it could end up committed or packaged.
+    """
+    errors: list[BaseException] = []
+    shutil.rmtree(stale, onexc=lambda _func, _path, exc: errors.append(exc))  # keep going, report once
+    if errors:
+        typer.echo(
+            f"⚠️  [{job.service_name}] Could not fully delete the old module dir; remove it by hand → {stale}\n"
+            f"  {errors[0]}"
+        )
+
+
+def _clear_module_dir(job: ServiceJob) -> threading.Thread | None:
+    """Move the existing module dir out of the way and delete it in the background.
+
+    The rename is a single syscall, so the generator can start on an empty dir right
+    away instead of waiting for `rmtree` to unlink every file of the old SDK.
+    Returns the deletion thread, if one was started.
+    """
+    stale = job.out_module_dir.with_name(f"{job.out_module_dir.name}.old.{os.getpid()}.{time.time_ns()}")
+    try:
+        job.out_module_dir.rename(stale)
+    except FileNotFoundError:
+        return None
+
+    typer.echo(f"🧹  [{job.service_name}] Clearing existing module dir → {job.out_module_dir}")
+    cleanup = threading.Thread(target=_remove_stale_dir, args=(job, stale), daemon=True)
+    cleanup.start()
+    return cleanup
+
+
+def _process_service(
+    job: ServiceJob,
+    *,
+    dumpers: WarmDumpers,
+    runners: GeneratorRunners,
+    cleanups: list[threading.Thread],
+) -> bool:
+    """Run one service through dump → generate; return False if its SDK generation failed."""
+    if not _dump_spec(job, dumpers):
+        return True  # skipped: dump failed or SDK already up to date
+
+    # Ensure output module directory exists (and clear it to avoid stale files)
+    if cleanup := _clear_module_dir(job):
+        cleanups.append(cleanup)
+
+    job.out_module_dir.mkdir(parents=True, exist_ok=True)
+
+    typer.echo(f"🚀  [{job.service_name}] Generating SDK → {job.out_module_dir}")
+    try:
+        ok, output = runners.generate(job)
+        if ok:
+            job.record_spec_hash()
+    finally:
+        job.discard_spec()  # also on Ctrl-C, so no temp spec is left behind
+
+    if ok:
+        typer.echo(f"✅  [{job.service_name}] SDK ready\n")
+    else:
+        typer.echo(f"❌  [{job.service_name}] SDK generation failed.\n\nOUTPUT:\n{output}\n")
+    return ok
+
+
+def _run_pipeline(jobs: list[ServiceJob], *, max_workers: int, timeout: float) -> list[ServiceJob]:
+    """Run every service through dump → generate on a thread pool.
+
+    Worker threads only block on child processes, which releases the GIL, so one
+    service's spec dump overlaps another's SDK generation without the cost of a
+    process pool. Dumps get a fresh process per service; generation reuses one
+    long-lived runner per worker, which is killed if one service's generation takes
+    longer than `timeout` seconds. Returns the jobs whose generation failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    dumpers = WarmDumpers(total=len(jobs), spares=max_workers)
+    runners = GeneratorRunners(timeout)
+    cleanups: list[threading.Thread] = []
+    process = partial(_process_service, dumpers=dumpers, runners=runners, cleanups=cleanups)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                results = list(pool.map(process, jobs))
+            except KeyboardInterrupt:
+                pool.shutdown(cancel_futures=True)  # don't start queued services after Ctrl-C
+                raise
+    finally:
+        runners.close()
+        dumpers.close()
+        for cleanup in cleanups:  # don't leave half-deleted *.old.* dirs behind on exit
+            cleanup.join()
+
+    return [job for job, ok in zip(jobs, results, strict=True) if not ok]
 
-        typer.echo(f"🚀  [{service_name}] Generating SDK → {out_module_dir}")
-        subprocess.run(cmd, check=True)
-        typer.echo(f"✅  [{service_name}] SDK ready\n")
 
-    if not any_found:
+# ------------------------------------------------------------------ #
+# CLI command                                                        #
+# ------------------------------------------------------------------ #
+@app.command()
+def generate(
+    dry: bool = typer.Option(False, "--dry", "--dry-run", help="Preview only, don't write files"),
+    keep_spec: bool = typer.Option(
+        False, "--keep-spec", help="Also keep each OpenAPI JSON at the org root as <service>-openapi.json"
+    ),
+    force: bool = typer.Option(False, "--force", help="Regenerate SDKs even when their OpenAPI spec is unchanged"),
+    timeout: float = typer.Option(
+        GENERATE_TIMEOUT,
+        "--timeout",
+        envvar="AB_GENERATE_TIMEOUT",
+        min=1,
+        help="Seconds one service's SDK generation may take before it is killed",
+    ),
+) -> None:
+    """Generate (or preview) client SDK modules for each FastAPI service."""
+    if dry:
+        typer.echo("🌿  DRY-RUN – no files will be written.\n")
+
+    jobs = [
+        ServiceJob.plan(service, module_path, keep_spec=keep_spec, force=force)
+        for service, module_path in iter_service_module_names()
+    ]
+    if not jobs:
         typer.echo("❗  No FastAPI services found in the 'ab_service.' namespace")
+        return
+
+    if dry:
+        for job in jobs:
+            _preview_service(job)
+        return
+
+    failed = _run_pipeline(jobs, max_workers=min(MAX_WORKERS, len(jobs)), timeout=timeout)
+    if failed:
+        typer.echo("❌  SDK generation failed for: " + ", ".join(job.service_name for job in failed))
+        raise typer.Exit(code=1)
 
 
 def main() -> None:  # Poetry entry-point
@@ -0,0 +1,238 @@
+"""Tests for `cli generate`: service discovery, skipping unchanged SDKs and retrying generator runners."""
+
+import subprocess
+import sys
+import tempfile
+import textwrap
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+import pytest
+from ab_client_generator import cli
+from ab_client_generator.cli import (
+    GENERATE_ATTEMPTS,
+    SPEC_HASH_FILE,
+    GeneratorRunner,
+    GeneratorRunners,
+    ServiceJob,
+    _dump_spec,
+    iter_service_module_names,
+)
+
+SPEC = b'{"openapi": "3.1.0"}'
+
+
+def test_iter_service_module_names_lists_two_levels_without_importing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Only `ab_service.<svc>.main` is found, and nothing under `ab_service` is imported."""
+    ns = tmp_path / "ab_service"  # namespace package: no __init__.py
+    boom = 'raise RuntimeError("service code must not be imported during discovery")\n'
+    for rel in (
+        "svc_a/__init__.py",
+        "svc_a/main.py",  # found
+        "svc_b/__init__.py",
+        "svc_b/api/__init__.py",
+        "svc_b/api/main.py",  # too deep
+        "svc_c/__init__.py",  # package without main
+        "main.py",  # not a service package
+        "loose.py",
+    ):
+        (ns / rel).parent.mkdir(parents=True, exist_ok=True)
+        (ns / rel).write_text(boom)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in [name for name in sys.modules if name.partition(".")[0] == "ab_service"]:
+        monkeypatch.delitem(sys.modules, name)
+
+    found = dict(iter_service_module_names())
+
+    assert found["svc_a"] == "ab_service.svc_a.main"
+    assert not {"svc_b", "svc_c", "main", "loose"} & found.keys()
+    assert not [name for name in sys.modules if name.partition(".")[0] == "ab_service"]
+
+
+@pytest.fixture
+def job(tmp_path: Path) -> ServiceJob:
+    """Build a job whose module dir lives under a temp dir and whose spec is already dumped."""
+    return ServiceJob(
+        service="svc",
+        module_path="ab_service.svc.main",
+        service_name="service-svc",
+        out_module_dir=tmp_path / "svc",
+        spec=SPEC,
+    )
+
+
+def _make_sdk(job: ServiceJob) -> None:
+    job.out_module_dir.mkdir()
+    (job.out_module_dir / "__init__.py").touch()
+
+
+class _FakeDumpers:
+    """Stands in for `WarmDumpers`: each "dumper" just echoes `SPEC` on stdout."""
+
+    def take(self) -> tuple[subprocess.Popen[bytes], IO[bytes]]:
+        proc = subprocess.Popen(
+            [sys.executable, "-c", f"import sys; sys.stdin.read(); sys.stdout.write({SPEC.decode()!r})"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        return proc, tempfile.TemporaryFile()
+
+
+def test_sdk_is_current_without_module_dir(job: ServiceJob) -> None:
+    """No module dir means there is no SDK to keep."""
+    assert not job.sdk_is_current()
+
+
+def test_sdk_is_current_without_hash_file(job: ServiceJob) -> None:
+    """An SDK without a recorded spec hash (e.g. generated before hashing) is regenerated."""
+    _make_sdk(job)
+    assert not job.sdk_is_current()
+
+
+def test_sdk_is_current_with_matching_hash(job: ServiceJob) -> None:
+    """An SDK generated from an identical spec is current."""
+    _make_sdk(job)
+    job.record_spec_hash()
+    assert (job.out_module_dir / SPEC_HASH_FILE).read_text().strip() == job.spec_hash
+    assert job.sdk_is_current()
+
+
+def test_sdk_is_current_with_different_hash(job: ServiceJob) -> None:
+    """A changed spec makes the SDK stale."""
+    _make_sdk(job)
+    job.record_spec_hash()
+    job.spec = b'{"openapi": "3.1.0", "paths": {}}'
+    assert not job.sdk_is_current()
+
+
+def test_dump_spec_skips_current_sdk(job: ServiceJob) -> None:
+    """A current SDK is skipped without writing a spec for the generator."""
+    _make_sdk(job)
+    job.record_spec_hash()
+    assert not _dump_spec(job, _FakeDumpers())
+    assert job.spec_path is None
+
+
+def test_dump_spec_force_bypasses_current_sdk(job: ServiceJob) -> None:
+    """`--force` regenerates even a current SDK."""
+    _make_sdk(job)
+    job.record_spec_hash()
+    job.force = True
+    try:
+        assert _dump_spec(job, _FakeDumpers())
+        assert job.spec_path is not None and job.spec_path.read_bytes() == SPEC
+    finally:
+        job.discard_spec()
+
+
+# Stands in for `ab_client_generator._batch_runner`. argv: <mode> <starts file>.
+# Every start appends a byte to the starts file, so tests can count runner spawns.
+FAKE_RUNNER = textwrap.dedent(
+    """
+    import json, os, sys, time
+    from pathlib import Path
+
+    mode, starts = sys.argv[1], Path(sys.argv[2])
+    with starts.open("a") as f:
+        f.write("x")
+    first_start = len(starts.read_text()) == 1
+
+    for line in sys.stdin:
+        if mode == "fails":
+            print("bad spec", file=sys.stderr)
+            ok = False
+        elif mode == "dies-once" and first_start:
+            os._exit(1)
+        elif mode == "hangs":
+            time.sleep(60)
+        else:
+            ok = True
+        print(json.dumps({"ok": ok}), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def fake_runner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, job: ServiceJob) -> Callable[[str], Path]:
+    """Return a helper that points `RUNNER_CMD` at `FAKE_RUNNER` in a mode, giving its starts file."""
+    script = tmp_path / "fake_runner.py"
+    script.write_text(FAKE_RUNNER)
+    starts = tmp_path / "starts"
+    starts.touch()
+    job.spec_path = tmp_path / "openapi.json"
+    monkeypatch.setattr(cli.time, "sleep", lambda _seconds: None)  # skip retry backoff
+
+    def use(mode: str) -> Path:
+        monkeypatch.setattr(cli, "RUNNER_CMD", [sys.executable, str(script), mode, str(starts)])
+        return starts
+
+    return use
+
+
+def _generate(job: ServiceJob, timeout: float = 10) -> tuple[bool, str]:
+    runners = GeneratorRunners(timeout)
+    try:
+        return runners.generate(job)
+    finally:
+        runners.close()
+
+
+def test_generate_ok(fake_runner: Callable[[str], Path], job: ServiceJob) -> None:
+    """A runner that replies ok stays up for the next job."""
+    starts = fake_runner("ok")
+    runner = GeneratorRunner()
+    try:
+        assert runner.generate(job, timeout=10) == (True, "")
+        assert runner.alive
+        assert not runner.timed_out
+    finally:
+        runner.close()
+    assert starts.read_text() == "x"
+
+
+def test_generate_reported_failure_is_not_retried(fake_runner: Callable[[str], Path], job: ServiceJob) -> None:
+    """A failure the generator reports itself comes back with its output, without a retry."""
+    starts = fake_runner("fails")
+    ok, output = _generate(job)
+    assert not ok
+    assert "bad spec" in output
+    assert starts.read_text() == "x"
+
+
+def test_generate_retries_on_fresh_runner_when_runner_dies(fake_runner: Callable[[str], Path], job: ServiceJob) -> None:
+    """A runner that exits mid-job is reaped, then the job is retried on a fresh runner."""
+    fake_runner("dies-once")
+    runner = GeneratorRunner()
+    try:
+        assert runner.generate(job, timeout=10) == (False, "")
+        assert not runner.alive  # reaped on EOF, so it is never reused
+        assert runner.proc.returncode == 1
+        assert not runner.timed_out
+    finally:
+        runner.close()
+
+    starts = fake_runner("dies-once")
+    starts.write_text("")
+    assert _generate(job) == (True, "")
+    assert starts.read_text() == "xx"
+
+
+def test_generate_kills_hung_runner_after_timeout(fake_runner: Callable[[str], Path], job: ServiceJob) -> None:
+    """A hung runner is killed after `timeout`, and the job fails without a retry."""
+    starts = fake_runner("hangs")
+    runner = GeneratorRunner()
+    try:
+        ok, _output = runner.generate(job, timeout=0.5)
+        assert not ok
+        assert runner.timed_out
+        assert not runner.alive
+    finally:
+        runner.close()
+
+    starts.write_text("")
+    assert not _generate(job, timeout=0.5)[0]
+    assert starts.read_text() == "x"
+    assert GENERATE_ATTEMPTS > 1  # so a single start really means "not retried"